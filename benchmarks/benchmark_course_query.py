@@ -0,0 +1,62 @@
+"""
+Benchmark lookups of the course_query snapshot
+
+python -m benchmarks.benchmark_course_query
+"""
+import time
+import src.course_query as crs_query
+
+SUBJECTS = ["CSC", "ECE", "MA", "ST", "MAE"]
+TERMS = ["2191", "2196", "2198"]
+STATUSES = ["Open 10/40", "Closed 40/40", "Waitlist 2/5"]
+
+
+def create_courses(num_courses):
+    courses = {}
+    for index in range(num_courses):
+        subject = SUBJECTS[index % len(SUBJECTS)]
+        term = TERMS[index % len(TERMS)]
+        num = str(index)
+        courses[subject + ":" + num + " - " + term] = {
+            'subject': subject,
+            'num': num,
+            'term': term,
+            'stud_email': {"student" + str(index % 5000) + "@ncsu.edu": "Student"},
+            'stud_phnum': {},
+            'location': ["Engineering Building II"],
+            'status': [STATUSES[(index // 7) % len(STATUSES)]],
+            'name': "Course " + num
+        }
+    return courses
+
+
+def time_per_call(func, calls):
+    start = time.perf_counter()
+    for index in range(calls):
+        func(index)
+    return (time.perf_counter() - start) / calls
+
+
+def main(num_courses=50000, calls=1000):
+    courses = create_courses(num_courses)
+    names = list(courses)
+
+    start = time.perf_counter()
+    crs_query.load_snapshot(courses)
+    print("Courses: {}".format(num_courses))
+    print("  load snapshot:           {:8.3f} s".format(time.perf_counter() - start))
+
+    lookups = [
+        ("get course", lambda index: crs_query.get_course(names[index % num_courses])),
+        ("query by email", lambda index: crs_query.query_courses(email="student" + str(index) + "@ncsu.edu")),
+        ("open CSC in 2198, page", lambda index: crs_query.query_courses(subject="CSC", term="2198",
+                                                                          status="open", limit=20))
+    ]
+    for name, lookup in lookups:
+        print("  {:24} {:8.1f} us".format(name + ":", time_per_call(lookup, calls) * 1000000))
+
+    crs_query.clear_snapshot()
+
+
+if __name__ == '__main__':
+    main()
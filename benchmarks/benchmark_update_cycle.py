@@ -0,0 +1,58 @@
+"""
+Benchmark the status compare and email mapping of an update cycle
+
+Times compare_and_get_updates + map_courses_to_emails of course_fetcher on the changed courses,
+as done by the scheduler job, up to 1M sections.
+
+python -m benchmarks.benchmark_update_cycle
+"""
+import copy
+import time
+import src.course_fetcher as crs_fchr
+
+SECTIONS = 4
+
+
+def create_courses(num_courses):
+    courses = {}
+    for index in range(num_courses):
+        courses["CSC:" + str(index) + " - Fall 2019"] = {
+            'subject': "CSC",
+            'num': str(index),
+            'term': "2198",
+            'stud_email': {"student" + str((index + seat) % 5000) + "@ncsu.edu": "Student" for seat in range(3)},
+            'status': ["Open " + str((index * 7 + section) % 41) + "/40" for section in range(SECTIONS)]
+        }
+    return courses
+
+
+def update_courses(courses, step):
+    # statuses are parsed again on every fetch, so updated details never share strings with saved ones
+    updated = copy.deepcopy(courses)
+    for index, cr_details in enumerate(updated.values()):
+        statuses = ["".join(list(status)) for status in cr_details['status']]
+        if index % step == 0:
+            statuses[1] = "Closed 40/40"
+        cr_details['status'] = statuses
+    return updated
+
+
+def main():
+    crs_fchr.logger.disable(crs_fchr.logger.CRITICAL)  # updated courses are logged one by one
+
+    for num_courses in [25000, 250000]:
+        courses = create_courses(num_courses)
+        updated = update_courses(courses, 250)
+
+        start = time.perf_counter()
+        changes = crs_fchr.compare_and_get_updates(courses, updated)
+        compared = time.perf_counter()
+        crs_fchr.map_courses_to_emails({cr_name: updated[cr_name] for cr_name in changes})
+        mapped = time.perf_counter()
+
+        print("Sections: {:8}  changed courses {:5}  compare {:6.3f} s  map emails {:6.3f} s"
+              .format(num_courses * SECTIONS, len(changes), compared - start, mapped - compared))
+
+
+if __name__ == '__main__':
+    main()
@@ -25,6 +25,7 @@ class Config:
     course_avail_xpath = "//*[@class=\"table section-table table-striped table-condensed\"]/tr[#ROW#]/td[4]"
     course_loc_xpath = "//*[@class=\"table section-table table-striped table-condensed\"]/tr[#ROW#]/td[6]"
     course_name_xpath = "//*[@class=\"course\"]/h1/small"
+    course_listing_xpath = "//*[@class=\"course\"]"
 
     # EMAIL SENDER
     smtp_server = "smtp.gmail.com"
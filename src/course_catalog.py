@@ -0,0 +1,192 @@
+"""
+Catalog index of terms and courses
+
+The module performs:
+ 1) Load term name to term code mapping once
+ 2) Derive term codes of terms not listed in the mapping, eg. Spring 2020 -> 2201
+ 3) Normalize courses to compact keys (subject, number, term code)
+ 4) Cache course listings of a subject for a term
+
+Author:
+    Sanveg Rane
+"""
+import logging as logger
+import src.json_handler as json_hndlr
+from resources.config import Config as Config
+
+# NCSU term code: century digit + two digit year + season digit, eg. Fall 2019 -> 2198
+SEASON_CODES = {
+    "spring": "1",
+    "summer": "6",
+    "summer 1": "6",
+    "summer i": "6",
+    "summer 2": "7",
+    "summer ii": "7",
+    "fall": "8"
+}
+SEASON_NAMES = {"1": "Spring", "6": "Summer", "7": "Summer II", "8": "Fall"}
+
+_term_codes = None  # term name to code, loaded once from course-term.json
+_term_names = None  # term code to name
+_subject_listings = {}  # (subject, term code) to {course number: course page}
+
+
+def load_term_codes():
+    """
+    Read the term mappings from resources, executed once on first use
+    """
+    global _term_codes
+    global _term_names
+
+    term_codes = {}
+    try:
+        for term_name, term_code in json_hndlr.read_json(Config.course_term_loc).items():
+            term_codes[_normalize_term_name(term_name)] = term_code
+    except Exception as error:
+        logger.error("Error reading course terms file: {}".format(error))
+
+    _term_names = {term_code: term_name.title() for term_name, term_code in term_codes.items()}
+    _term_codes = term_codes
+
+
+def _normalize_term_name(term_name):
+    return " ".join(term_name.lower().split())
+
+
+def get_term_code(term):
+    """
+    Get code of the term, terms not in the mapping are derived from the name
+    Args:
+        term: Term name eg. Fall 2019, or term code eg. 2198, codes must end with a season digit
+
+    Returns:
+        Term code or None if term could not be resolved
+    """
+    term = str(term).strip()
+    if term.isdigit() and len(term) == 4:
+        if term[-1] in SEASON_NAMES:
+            return term
+        logger.error("Invalid term code: " + term)
+        return None
+
+    if _term_codes is None:
+        load_term_codes()
+
+    term_name = _normalize_term_name(term)
+    if term_name in _term_codes:
+        return _term_codes[term_name]
+
+    term_code = derive_term_code(term_name)
+    if term_code is not None:
+        _term_codes[term_name] = term_code
+    else:
+        logger.error("Invalid term: " + term)
+
+    return term_code
+
+
+def derive_term_code(term_name):
+    """
+    Create the term code from season and year, eg. Fall 2019 -> 2198
+    Args:
+        term_name: Term name in format season year
+
+    Returns:
+        Term code or None if the name is not in the expected format
+    """
+    words = _normalize_term_name(term_name).split()
+    if len(words) < 2 or not words[-1].isdigit() or len(words[-1]) != 4:
+        return None
+
+    season = " ".join(words[:-1])
+    year = int(words[-1])
+    if season not in SEASON_CODES or year < 1900:
+        return None
+
+    return str((year - 1800) // 100) + "{:02d}".format(year % 100) + SEASON_CODES[season]
+
+
+def get_term_name(term):
+    """
+    Get the display name of a term, eg. 2198 -> Fall 2019
+    Args:
+        term: Term name or term code
+
+    Returns:
+        Term name or None if term could not be resolved
+    """
+    term_code = get_term_code(term)
+    if term_code is None:
+        return None
+
+    if _term_codes is None:
+        load_term_codes()
+
+    if term_code not in _term_names:
+        season = SEASON_NAMES.get(term_code[-1])
+        if season is None:
+            return term_code
+        year = (int(term_code[0]) + 18) * 100 + int(term_code[1:3])
+        _term_names[term_code] = season + " " + str(year)
+
+    return _term_names[term_code]
+
+
+def get_course_key(subject, course_id, term):
+    """
+    Normalize course details to a compact key, eg. ("CSC", "501", "2198")
+    Args:
+        subject: Subject of course
+        course_id: Course id / number
+        term: Term name or term code
+
+    Returns:
+        Tuple of subject, number and term code, None if term could not be resolved
+    """
+    term_code = get_term_code(term)
+    if term_code is None:
+        return None
+    return subject.strip().upper(), course_id.strip(), term_code
+
+
+def set_subject_listing(subject, term, listing):
+    """
+    Cache the course listing of a subject for a term
+    Listings are only needed while resolving new courses, clear them once resolved
+    Args:
+        subject: Subject of courses
+        term: Term name or term code
+        listing: Dict of course number and course page
+    """
+    _subject_listings[(subject.strip().upper(), get_term_code(term))] = listing
+
+
+def get_subject_listing(subject, term):
+    """
+    Returns:
+        Cached course listing of a subject for a term, None if not fetched
+    """
+    return _subject_listings.get((subject.strip().upper(), get_term_code(term)))
+
+
+def get_listed_course(course_key):
+    """
+    Find the course in the cached subject listings
+    Args:
+        course_key: Key of course created by get_course_key
+
+    Returns:
+        Cached course page or None if the course is not listed
+    """
+    subject, course_id, term_code = course_key
+    listing = _subject_listings.get((subject, term_code))
+    if listing is None:
+        return None
+    return listing.get(course_id)
+
+
+def clear_subject_listings():
+    """
+    Remove all cached subject listings
+    """
+    _subject_listings.clear()
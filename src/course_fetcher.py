@@ -14,6 +14,8 @@ Author:
 import requests as req
 import logging as logger
 import src.json_handler as json_hndlr
+import src.course_query as crs_query
+import src.course_catalog as crs_catalog
 import copy
 from lxml import html
 from resources.config import Config as Config
@@ -31,11 +33,14 @@ def init_courses_data():
     """
     student_courses = json_hndlr.read_json(Config.student_course_loc)
     courses_details = parse_course_data(student_courses)
-    update_course_status(courses_details)
+    prefetch_subject_listings(courses_details)
+    update_course_status(courses_details, use_listings=True)
+    crs_catalog.clear_subject_listings()
     clean_invalid_subjects(courses_details)
 
     file_loc = Config.temp_loc + Config.course_file_name
     json_hndlr.write_json(courses_details, file_loc)
+    crs_query.load_snapshot(courses_details)
 
 
 def parse_course_data(student_courses):
@@ -49,25 +54,32 @@ def parse_course_data(student_courses):
         List if student courses to be fetched for status
     """
     course_details_map = {}
-    course_term_map = json_hndlr.read_json(Config.course_term_loc)
+    course_names = {}  # course key to course name, to merge entries of same course
 
     for student_data in student_courses.values():
         # iterating all courses in the object
         for cr_num, cr_term in student_data["courses"].items():
-            c_subject = student_data["subject"]
-            course_name = get_course_name(c_subject, cr_num, cr_term)
+            course_key = crs_catalog.get_course_key(student_data["subject"], cr_num, cr_term)
+            if course_key is None:
+                logger.error("Skipping course with invalid term: {} - {}".format(cr_num, cr_term))
+                continue
 
             # create a new course entry in course details
-            if course_name not in course_details_map:
+            if course_key not in course_names:
+                c_subject, c_num, c_term = course_key
+                course_name = get_course_name(c_subject, c_num, crs_catalog.get_term_name(c_term))
                 course_detail = {
                     'subject': c_subject,
-                    'num': cr_num,
-                    'term': course_term_map[cr_term],
+                    'num': c_num,
+                    'term': c_term,
                     "stud_email": {},
                     "stud_phnum": {}
                 }
+                course_names[course_key] = course_name
                 course_details_map[course_name] = course_detail
 
+            course_name = course_names[course_key]
+
             # add student email details to the course
             course_details_map[course_name]["stud_email"][student_data["email"]] = student_data["name"]
 
@@ -77,15 +89,22 @@ def parse_course_data(student_courses):
     return course_details_map
 
 
-def update_course_status(courses):
+def update_course_status(courses, use_listings=False):
     """
     For each course fetch details and adds to the course
     If data for course is not available, it sets flag invalid as True
     Args:
         courses: list of courses to query data for
+        use_listings: boolean, if set to true, use cached subject listings before fetching the course
     """
     for detail in courses.values():
-        subject_data = get_search_details_page(detail)
+        subject_data = None
+        if use_listings is True:
+            course_key = (detail["subject"], detail["num"], detail["term"])
+            subject_data = crs_catalog.get_listed_course(course_key)
+
+        if subject_data is None:
+            subject_data = get_search_details_page(detail)
 
         if subject_data is not None:
             fetch_status_from_response(detail, subject_data)
@@ -132,6 +151,88 @@ def get_search_details_page(course):
         logger.error("Error fetching data for course: " + course_name)
 
 
+def prefetch_subject_listings(courses):
+    """
+    Fetch all courses of each subject and term once and cache them in the catalog
+    Args:
+        courses: list of courses whose subjects are to be fetched
+    """
+    subject_terms = set((detail["subject"], detail["term"]) for detail in courses.values())
+
+    for subject, term in subject_terms:
+        if crs_catalog.get_subject_listing(subject, term) is not None:
+            continue
+
+        listing_page = get_subject_listing_page(subject, term)
+        if listing_page is not None:
+            crs_catalog.set_subject_listing(subject, term, split_subject_listing(listing_page))
+
+
+def get_subject_listing_page(subject, term):
+    """
+    Fetch HTML of all courses of a subject in a term from NCSU search script
+    Args:
+        subject: Subject of courses
+        term: Term code of courses
+
+    Returns:
+        HTML page retrieved from the endpoint converted from string
+    """
+    listing_name = subject + "-" + term
+    logger.info("Fetching course listing for: " + listing_name)
+
+    params = {
+        'subject': subject,
+        'course-number': '0',
+        'term': term,
+        'course-inequality': '>=',
+        'to': '1',
+        'table-only': '0'
+    }
+
+    resp = None
+    try:
+        resp = req.post(Config.search_URL, data=params)
+    except Exception as error:
+        logger.error("Error fetching course listing: {}".format(error))
+
+    if resp:
+        data = resp.json()
+        if data:
+            logger.debug("Fetched course listing: " + listing_name)
+            return html.fromstring(data['html'])
+        else:
+            logger.error("Invalid course listing: " + listing_name)
+    else:
+        logger.error("Error fetching course listing: " + listing_name)
+
+
+def split_subject_listing(listing_page):
+    """
+    Split the listing into a page per course, so it is read the same way as a single course search
+    Args:
+        listing_page: Extracted page from search script result for a subject
+
+    Returns:
+        Dict of course number and the HTML of the course
+    """
+    listing = {}
+    for course_html in listing_page.xpath(Config.course_listing_xpath):
+        # course sections are identified as SUBJECT-NUMBER, eg. CSC-501, else read from the heading "CSC 501"
+        course_id = course_html.get("id", "").split("-")[-1].strip()
+        if not course_id:
+            heading = course_html.xpath("./h1/text()")
+            words = heading[0].split() if heading else []
+            course_id = words[1] if len(words) > 1 else ""
+
+        if course_id:
+            listing[course_id] = html.fromstring(html.tostring(course_html))
+        else:
+            logger.error("Skipping course without number in listing")
+
+    return listing
+
+
 def fetch_status_from_response(course_detail, html_page):
     """
     Parse the HTML and use xpath to fetch course status and location of course
@@ -223,6 +324,7 @@ def update_crs_details_and_get_updates():
         logger.debug("Number of courses updated: {}".format(str(len(changes))))
 
         json_hndlr.write_json(updated_data, cr_details_file_loc)
+        crs_query.load_snapshot(updated_data)
     except Exception as error:
         logger.error("Error updating course statuses: " + str(error), error)
 
@@ -251,7 +353,7 @@ def compare_and_get_updates(saved_details, updated_details):
 
 def get_course_name(subject, course_id, term):
     """
-    Course is defined as subject + : + number + - + term. eg. CSC:501-2198
+    Course is defined as subject + : + number + - + term. eg. CSC:501 - Fall 2019
     Args:
         subject: Subject of course
         course_id: Course id / number
@@ -273,6 +375,12 @@ def get_course_data(course_list, get_all_data):
     Returns:
         Dict of course name and corresponding data
     """
+    # serve from the in memory snapshot once it is loaded
+    if crs_query.get_version() > 0:
+        if get_all_data is True:
+            return crs_query.query_courses()
+        return crs_query.get_courses(course_list)
+
     courses_data = None
     try:
         cr_details_file_loc = Config.temp_loc + Config.course_file_name
@@ -287,9 +395,9 @@ def get_course_data(course_list, get_all_data):
             fetched_data = courses_data
 
         else:
-            # fetch course in generated course file
+            # fetch course in generated course file, skip courses no longer tracked
             for cr_name in course_list:
-                crs_det = courses_data[cr_name]
+                crs_det = courses_data.get(cr_name)
                 if crs_det is not None:
                     fetched_data[cr_name] = crs_det
 
@@ -0,0 +1,210 @@
+"""
+Read only query layer over the tracked courses
+
+The module keeps an in memory snapshot of the course details along with
+indexes on course name, subject, term, subscriber email and section status.
+A new snapshot is built after each update cycle and swapped in as a whole,
+so readers always see a consistent version of the data.
+Course details returned by the lookups belong to the snapshot and must not be modified.
+
+Author:
+    Sanveg Rane
+"""
+import copy
+import logging as logger
+import src.course_catalog as crs_catalog
+
+_snapshot = None  # current snapshot, replaced as a whole on every load
+
+
+def load_snapshot(courses_data):
+    """
+    Build a new snapshot from the course details and make it the current one
+    Args:
+        courses_data: Dict of course name and corresponding data
+
+    Returns:
+        Version number of the loaded snapshot
+    """
+    global _snapshot
+
+    snapshot = build_snapshot(courses_data, get_version() + 1)
+    _snapshot = snapshot  # single reference assignment, readers never see a partial snapshot
+
+    logger.debug("Loaded course snapshot version {} with {} courses".format(snapshot["version"],
+                                                                            len(snapshot["courses"])))
+    return snapshot["version"]
+
+
+def clear_snapshot():
+    """
+    Remove the current snapshot, lookups return no courses until the next load
+    """
+    global _snapshot
+    _snapshot = None
+
+
+def build_snapshot(courses_data, version):
+    """
+    Create the snapshot dict and indexes for the course details
+    The details are copied, so later changes by the fetcher do not affect the snapshot or its indexes
+    Args:
+        courses_data: Dict of course name and corresponding data
+        version: Version number of the snapshot
+
+    Returns:
+        Snapshot dict with courses and indexes
+    """
+    courses = copy.deepcopy(courses_data)
+    names = sorted(courses)
+    by_subject = {}
+    by_term = {}
+    by_email = {}
+    by_status = {}
+
+    # names are added in sorted order, so every index entry stays sorted
+    for cr_name in names:
+        cr_detail = courses[cr_name]
+        _add_to_index(by_subject, cr_detail.get("subject"), cr_name)
+        _add_to_index(by_term, cr_detail.get("term"), cr_name)
+
+        for email in cr_detail.get("stud_email", {}):
+            _add_to_index(by_email, email, cr_name)
+
+        for status in cr_detail.get("status", []):
+            _add_to_index(by_status, get_status_code(status), cr_name)
+
+    return {
+        "version": version,
+        "courses": courses,
+        "names": names,
+        "subject": by_subject,
+        "term": by_term,
+        "email": by_email,
+        "status": by_status
+    }
+
+
+def _add_to_index(index, key, cr_name):
+    """
+    Index entries keep the course names as an ordered list and as a set for lookups
+    """
+    if key is None:
+        return
+    if key not in index:
+        index[key] = ([], set())
+
+    cr_names, cr_name_set = index[key]
+    if cr_name not in cr_name_set:
+        cr_names.append(cr_name)
+        cr_name_set.add(cr_name)
+
+
+def get_status_code(status):
+    """
+    Normalize the availability text of a section, eg. "Open 12/40" -> "open"
+    Args:
+        status: Availability text read from the course page
+
+    Returns:
+        Lower case first word of the status
+    """
+    words = status.split()
+    return words[0].lower() if words else ""
+
+
+def get_version():
+    """
+    Returns:
+        Version of the current snapshot, 0 if nothing is loaded
+    """
+    return _snapshot["version"] if _snapshot is not None else 0
+
+
+def get_course(cr_name):
+    """
+    Get details of a single course
+    Args:
+        cr_name: Name of the course, eg. CSC:501 - Fall 2019
+
+    Returns:
+        Course details or None if the course is not tracked
+    """
+    snapshot = _snapshot
+    if snapshot is None:
+        return None
+    return snapshot["courses"].get(cr_name)
+
+
+def get_courses(course_list):
+    """
+    Get details of the courses passed, unknown courses are skipped
+    Args:
+        course_list: List of course names
+
+    Returns:
+        Dict of course name and corresponding data
+    """
+    snapshot = _snapshot
+    if snapshot is None:
+        return {}
+
+    courses = snapshot["courses"]
+    return {cr_name: courses[cr_name] for cr_name in course_list if cr_name in courses}
+
+
+def query_courses(subject=None, term=None, email=None, status=None, offset=0, limit=None):
+    """
+    Filter the tracked courses, all filters passed must match
+    eg. query_courses(subject="CSC", term="Fall 2019", status="open")
+    Args:
+        subject: Subject of course
+        term: Term name or term code of course, no courses match a term that could not be resolved
+        email: Email of a subscribed student
+        status: Status of any section of the course, eg. open, closed, waitlist
+        offset: Number of matching courses to skip
+        limit: Max number of courses to return, all if None
+
+    Returns:
+        Dict of course name and corresponding data, ordered by course name
+    """
+    snapshot = _snapshot
+    if snapshot is None:
+        return {}
+
+    term_code = None
+    if term is not None:
+        term_code = crs_catalog.get_term_code(term)
+        if term_code is None:
+            return {}
+
+    filters = [
+        ("subject", subject),
+        ("term", term_code),
+        ("email", email),
+        ("status", get_status_code(status) if status is not None else None)
+    ]
+    matches = [snapshot[index].get(key, ([], set())) for index, key in filters if key is not None]
+
+    if matches:
+        # walk the smallest ordered entry and check the others, stop once the page is filled
+        matches.sort(key=lambda entry: len(entry[1]))
+        cr_names = matches[0][0]
+        other_sets = [cr_name_set for _, cr_name_set in matches[1:]]
+    else:
+        cr_names = snapshot["names"]
+        other_sets = []
+
+    end = None if limit is None else offset + limit
+    courses = snapshot["courses"]
+    fetched_data = {}
+    found = 0
+    for cr_name in cr_names:
+        if end is not None and found >= end:
+            break
+        if all(cr_name in cr_name_set for cr_name_set in other_sets):
+            if found >= offset:
+                fetched_data[cr_name] = courses[cr_name]
+            found += 1
+
+    return fetched_data
@@ -0,0 +1,48 @@
+"""
+Test course_catalog module
+
+python -m unittest test_course_catalog
+"""
+import unittest
+import src.course_catalog as crs_catalog
+
+
+class TestCourseCatalog(unittest.TestCase):
+    # term codes of listed and future terms
+    def test_get_term_code(self):
+        self.assertEqual(crs_catalog.get_term_code("Fall 2019"), "2198", "Listed term")
+        self.assertEqual(crs_catalog.get_term_code(" fall  2019 "), "2198", "Term name case and spacing")
+        self.assertEqual(crs_catalog.get_term_code("Spring 2021"), "2211", "Future spring term")
+        self.assertEqual(crs_catalog.get_term_code("Summer II 2020"), "2207", "Future summer term")
+        self.assertEqual(crs_catalog.get_term_code("2198"), "2198", "Term code")
+        self.assertIsNone(crs_catalog.get_term_code("Winter 2019"), "Invalid season")
+        self.assertIsNone(crs_catalog.get_term_code("Fall"), "Missing year")
+        self.assertIsNone(crs_catalog.get_term_code("2019"), "Invalid season digit")
+        self.assertEqual(crs_catalog.get_term_code(2198), "2198", "Term code as number")
+
+    # term names from term codes
+    def test_get_term_name(self):
+        self.assertEqual(crs_catalog.get_term_name("2198"), "Fall 2019", "Listed term")
+        self.assertEqual(crs_catalog.get_term_name("2201"), "Spring 2020", "Derived term")
+
+    # course keys are normalized to (subject, number, term code)
+    def test_get_course_key(self):
+        key = ("CSC", "501", "2198")
+        self.assertEqual(crs_catalog.get_course_key("csc ", "501", "Fall 2019"), key, "Course key")
+        self.assertEqual(crs_catalog.get_course_key("CSC", "501", "2198"), key, "Course key from term code")
+        self.assertIsNone(crs_catalog.get_course_key("CSC", "501", "Fal 2019"), "Invalid term")
+
+    # cached subject listings resolve courses locally
+    def test_subject_listing(self):
+        crs_catalog.set_subject_listing("csc", "Fall 2019", {"501": "course page"})
+
+        self.assertEqual(crs_catalog.get_listed_course(("CSC", "501", "2198")), "course page", "Listed course")
+        self.assertIsNone(crs_catalog.get_listed_course(("CSC", "999", "2198")), "Course not listed")
+        self.assertIsNone(crs_catalog.get_listed_course(("ECE", "501", "2198")), "Subject not fetched")
+
+        crs_catalog.clear_subject_listings()
+        self.assertIsNone(crs_catalog.get_subject_listing("CSC", "2198"), "Cleared listings")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,25 @@ Test course_fetcher module
 
 python -m unittest test_course_fetcher
 """
+import os
 import unittest
+from unittest import mock
+from lxml import html
+import src.course_catalog as crs_catalog
 import src.course_fetcher as crs_fchr
 import src.json_handler as json_hndlr
 
+LISTING_FILE = os.path.join(os.path.dirname(__file__), "test_listing.html")
+
+
+def read_listing_page():
+    with open(LISTING_FILE, mode="r", encoding="UTF-8") as listing_file:
+        return html.fromstring(listing_file.read())
+
+
+def create_course(num):
+    return {'subject': "CSC", 'num': num, 'term': "2198", "stud_email": {}, "stud_phnum": {}}
+
 
 class TestCourseFetcher(unittest.TestCase):
     # basic test
@@ -32,6 +47,36 @@ class TestCourseFetcher(unittest.TestCase):
         self.assertEqual(data['arr'][0], arr_val, "Reading json array")
         self.assertEqual(data['dict']['dictProp'], dict_val, "Reading json dict")
 
+    # listing is split into a page per course number
+    def test_split_subject_listing(self):
+        listing = crs_fchr.split_subject_listing(read_listing_page())
+        self.assertEqual(sorted(listing), ["501", "510"], "Courses in listing")
+
+    # statuses of new courses are read from the cached listing
+    def test_update_course_status_from_listings(self):
+        courses = {
+            "CSC:501 - Fall 2019": create_course("501"),
+            "CSC:510 - Fall 2019": create_course("510"),
+            "CSC:999 - Fall 2019": create_course("999")
+        }
+
+        with mock.patch.object(crs_fchr, "get_subject_listing_page", return_value=read_listing_page()) as listing, \
+                mock.patch.object(crs_fchr, "get_search_details_page", return_value=None) as search:
+            crs_fchr.prefetch_subject_listings(courses)
+            crs_fchr.update_course_status(courses, use_listings=True)
+            crs_catalog.clear_subject_listings()
+
+        listing.assert_called_once_with("CSC", "2198")
+        search.assert_called_once_with(courses["CSC:999 - Fall 2019"])
+
+        course = courses["CSC:501 - Fall 2019"]
+        self.assertEqual(course['status'], ["Open 10/40", "Closed 40/40"], "Statuses from listing")
+        self.assertEqual(course['location'], ["Engineering Building II 1231", "Distance Education"],
+                         "Locations from listing")
+        self.assertEqual(course['name'], "Operating Systems Principles", "Name from listing")
+        self.assertEqual(courses["CSC:510 - Fall 2019"]['status'], ["Waitlist 2/5"], "Course without id")
+        self.assertNotIn('status', courses["CSC:999 - Fall 2019"], "Course not listed")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+"""
+Test course_query module
+
+python -m unittest test_course_query
+"""
+import unittest
+import src.course_query as crs_query
+
+
+def create_course(subject, num, term, emails, statuses):
+    return {
+        'subject': subject,
+        'num': num,
+        'term': term,
+        'stud_email': {email: "Student" for email in emails},
+        'stud_phnum': {},
+        'location': ["Engineering Building II"] * len(statuses),
+        'status': statuses,
+        'name': "Course " + num
+    }
+
+
+class TestCourseQuery(unittest.TestCase):
+    def setUp(self):
+        self.courses = {
+            "CSC:501 - Fall 2019": create_course("CSC", "501", "2198", ["a@ncsu.edu"], ["Open 10/40"]),
+            "CSC:510 - Fall 2019": create_course("CSC", "510", "2198", ["a@ncsu.edu", "b@ncsu.edu"],
+                                                 ["Closed 40/40", "Waitlist 2/5"]),
+            "CSC:510 - Spring 2019": create_course("CSC", "510", "2191", ["b@ncsu.edu"], ["Open 1/40"]),
+            "ECE:506 - Fall 2019": create_course("ECE", "506", "2198", ["c@ncsu.edu"], ["Open 5/60"])
+        }
+        crs_query.load_snapshot(self.courses)
+
+    def tearDown(self):
+        crs_query.clear_snapshot()
+
+    # each load creates a new version
+    def test_load_snapshot_version(self):
+        version = crs_query.get_version()
+        self.assertEqual(crs_query.load_snapshot(self.courses), version + 1, "Snapshot version")
+
+    # unknown courses do not raise
+    def test_get_course(self):
+        self.assertEqual(crs_query.get_course("CSC:501 - Fall 2019")['num'], "501", "Known course")
+        self.assertIsNone(crs_query.get_course("CSC:999 - Fall 2019"), "Unknown course")
+
+        data = crs_query.get_courses(["CSC:501 - Fall 2019", "CSC:999 - Fall 2019"])
+        self.assertEqual(list(data), ["CSC:501 - Fall 2019"], "Unknown course skipped")
+
+    # snapshot is not affected by changes to the loaded details
+    def test_snapshot_copies_details(self):
+        self.courses["CSC:501 - Fall 2019"]['status'][0] = "Closed 40/40"
+        self.courses["CSC:501 - Fall 2019"]['stud_email']["z@ncsu.edu"] = "Student"
+
+        self.assertEqual(crs_query.get_course("CSC:501 - Fall 2019")['status'], ["Open 10/40"], "Copied status")
+        self.assertEqual(crs_query.query_courses(email="z@ncsu.edu"), {}, "Copied emails")
+
+    # cleared snapshot returns no courses
+    def test_clear_snapshot(self):
+        crs_query.clear_snapshot()
+        self.assertEqual(crs_query.get_version(), 0, "No snapshot version")
+        self.assertEqual(crs_query.query_courses(), {}, "No courses")
+
+    # all open CSC sections in Fall 2019
+    def test_query_courses_filters(self):
+        data = crs_query.query_courses(subject="CSC", term="2198", status="Open")
+        self.assertEqual(list(data), ["CSC:501 - Fall 2019"], "Open CSC courses in Fall 2019")
+
+        data = crs_query.query_courses(subject="CSC", term="Fall 2019")
+        self.assertEqual(list(data), ["CSC:501 - Fall 2019", "CSC:510 - Fall 2019"], "Courses by term name")
+
+        data = crs_query.query_courses(email="b@ncsu.edu")
+        self.assertEqual(list(data), ["CSC:510 - Fall 2019", "CSC:510 - Spring 2019"], "Courses by email")
+
+        data = crs_query.query_courses(status="waitlist")
+        self.assertEqual(list(data), ["CSC:510 - Fall 2019"], "Courses by status")
+
+        self.assertEqual(crs_query.query_courses(subject="MA"), {}, "Unknown subject")
+        self.assertEqual(crs_query.query_courses(term="Fal 2019"), {}, "Invalid term")
+        self.assertEqual(crs_query.query_courses(subject="CSC", term="2019"), {}, "Invalid term code")
+
+    # pages are returned in course name order
+    def test_query_courses_pagination(self):
+        all_names = sorted(self.courses)
+        self.assertEqual(list(crs_query.query_courses()), all_names, "All courses")
+        self.assertEqual(list(crs_query.query_courses(offset=1, limit=2)), all_names[1:3], "Second page")
+        self.assertEqual(list(crs_query.query_courses(subject="CSC", offset=2, limit=2)), all_names[2:3],
+                         "Last partial page")
+
+
+if __name__ == '__main__':
+    unittest.main()